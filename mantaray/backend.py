@@ -185,7 +185,7 @@ class IrcCore:
     def __init__(self, server_config: config.ServerConfig):
         self._apply_config(server_config)
         self._sock: socket.socket | ssl.SSLSocket | None = None
-        self._send_queue: queue.Queue[tuple[bytes, _IrcEvent | None]] = queue.Queue()
+        self._send_queue: queue.Queue[tuple[bytes, list[_IrcEvent]]] = queue.Queue()
         self._recv_buffer: collections.deque[str] = collections.deque()
 
         self.event_queue: queue.Queue[_IrcEvent] = queue.Queue()
@@ -250,7 +250,12 @@ class IrcCore:
                 self._disconnect()
 
     def _send_soon(self, *parts: str, done_event: _IrcEvent | None = None) -> None:
-        self._send_queue.put((" ".join(parts).encode("utf-8") + b"\r\n", done_event))
+        self._send_queue.put(
+            (
+                " ".join(parts).encode("utf-8") + b"\r\n",
+                [] if done_event is None else [done_event],
+            )
+        )
 
     def _handle_received_message(self, msg: _ReceivedAndParsedMessage) -> None:
         if msg.command == "PRIVMSG":
@@ -416,7 +421,7 @@ class IrcCore:
         # Ideally it would be posible to wait until quit_event is set OR queue has something
         while not self._quit_event.is_set():
             try:
-                bytez, done_event = self._send_queue.get(timeout=0.1)
+                bytez, done_events = self._send_queue.get(timeout=0.1)
             except queue.Empty:
                 continue
 
@@ -433,7 +438,7 @@ class IrcCore:
                     traceback.print_exc()
                 continue
 
-            if done_event is not None:
+            for done_event in done_events:
                 self.event_queue.put(done_event)
                 if isinstance(done_event, SelfQuit):
                     self._quit_event.set()
@@ -502,6 +507,18 @@ class IrcCore:
             done_event=SentPrivmsg(nick_or_channel, text),
         )
 
+    # Sends all messages with one sendall(), useful when pasting many lines
+    def send_privmsg_many(self, nick_or_channel: str, texts: Sequence[str]) -> None:
+        self._send_queue.put(
+            (
+                b"".join(
+                    f"PRIVMSG {nick_or_channel} :{text}\r\n".encode("utf-8")
+                    for text in texts
+                ),
+                [SentPrivmsg(nick_or_channel, text) for text in texts],
+            )
+        )
+
     # emits SelfChangedNick event on success
     def change_nick(self, new_nick: str) -> None:
         self._send_soon("NICK", new_nick)
@@ -1,84 +1,90 @@
 """This file handles commands like /join."""
 from __future__ import annotations
 import re
+import sys
 from typing import Callable, TypeVar
-from tkinter import messagebox
 
-from mantaray.views import View, ChannelView, PMView
+from mantaray.views import View, ChannelView
 from mantaray.backend import IrcCore
 
 
 _CommandT = TypeVar("_CommandT", bound=Callable[..., None])
-_commands: dict[str, tuple[str, Callable[..., None]]] = {}
+# (usage_message, func, arg_names, required_arg_count, total_arg_count)
+_Command = tuple[tuple[str, list[str]], Callable[..., None], tuple[str, ...], int, int]
+_commands: dict[str, _Command] = {}
+
+# Shared between messages, must not be mutated
+_NO_TAGS: list[str] = []
+
+_USAGE_RE = re.compile(r"/[a-z]+( <[a-z_]+>)*( \[<[a-z_]+>\])*")
 
 
 def add_command(usage: str) -> Callable[[_CommandT], _CommandT]:
-    assert re.fullmatch(r"/[a-z]+( <[a-z_]+>)*( \[<[a-z_]+>\])*", usage)
+    if not _USAGE_RE.fullmatch(usage):
+        raise ValueError("invalid command usage: " + repr(usage))
+
+    name, *parts = usage.split()
+    name = sys.intern(name)  # makes dict lookups with other interned strings faster
+    # "<name>" or "[<name>]", as checked with the regex above
+    arg_names = tuple(part[2:-2] if part[0] == "[" else part[1:-1] for part in parts)
+    required = sum(1 for part in parts if part.startswith("<"))
+    usage_message = ("Usage: " + usage, _NO_TAGS)
 
     def do_it(func: _CommandT) -> _CommandT:
-        _commands[usage.split()[0]] = (usage, func)
+        _commands[name] = (usage_message, func, arg_names, required, len(parts))
         return func
 
     return do_it
 
 
-def _send_privmsg(view: View, core: IrcCore, message: str) -> None:
-    if isinstance(view, ChannelView):
-        core.send_privmsg(view.channel_name, message)
-    elif isinstance(view, PMView):
-        core.send_privmsg(view.other_nick, message)
-    else:
-        view.add_message(
-            "*",
-            (
-                (
-                    "You can't send messages here. "
-                    "Join a channel instead and send messages there."
-                ),
-                [],
-            ),
-        )
+def escape_message(s: str) -> str:
+    return "/" + s if s[:1] == "/" else s
 
 
-def escape_message(s: str) -> str:
-    if s.startswith("/"):
-        return "/" + s
-    return s
+# Same as re.fullmatch(r"/[a-z]+( .*)?", entry_content), but without regex
+def _looks_like_command(entry_content: str) -> bool:
+    if not entry_content.startswith("/"):
+        return False
+    name, _, rest = entry_content[1:].partition(" ")
+    return name.isascii() and name.isalpha() and name.islower() and "\n" not in rest
 
 
 def handle_command(view: View, core: IrcCore, entry_content: str) -> bool:
     if not entry_content:
         return False
 
-    if re.fullmatch("/[a-z]+( .*)?", entry_content):
-        try:
-            usage, func = _commands[entry_content.split()[0]]
-        except KeyError:
-            view.add_message(
-                "*", (f"No command named '{entry_content.split()[0]}'", [])
-            )
+    if _looks_like_command(entry_content):
+        command_name, _, rest = entry_content.partition(" ")
+        command = _commands.get(command_name)
+        if command is None:
+            view.add_message("*", (f"No command named '{command_name}'", _NO_TAGS))
             return False
+        usage_message, func, arg_names, required, total = command
 
         # Last arg can contain spaces
-        # Do not pass maxsplit=0 as that means "/lol asdf" --> ["/lol asdf"]
-        args = entry_content.split(maxsplit=max(usage.count(" "), 1))[1:]
-        if len(args) < usage.count(" <") or len(args) > usage.count(" "):
-            view.add_message("*", ("Usage: " + usage, []))
+        # For commands without arguments, maxsplit=-1 splits everything
+        args = rest.split(maxsplit=total - 1)
+        if not required <= len(args) <= total:
+            view.add_message("*", usage_message)
             return False
 
-        func(
-            view,
-            core,
-            **{name.strip("[<>]"): arg for name, arg in zip(usage.split()[1:], args)},
-        )
+        func(view, core, **dict(zip(arg_names, args)))
         return True
 
     if entry_content.startswith("//"):
-        lines = entry_content[1:].splitlines()
-    else:
-        lines = entry_content.splitlines()
+        entry_content = entry_content[1:]
+
+    # Usual case: a single line of text. All characters that splitlines()
+    # splits at are unprintable, so no need to split printable text.
+    if entry_content.isprintable():
+        view.send_outgoing(core, entry_content)
+        return True
+
+    lines = entry_content.splitlines()
 
     if len(lines) > 3:
+        from tkinter import messagebox
+
         # TODO: add button that pastebins?
         result = messagebox.askyesno(
             "Send multiple lines",
@@ -94,66 +100,70 @@ def handle_command(view: View, core: IrcCore, entry_content: str) -> bool:
         if not result:
             return False
 
-    for line in lines:
-        _send_privmsg(view, core, line)
+    view.send_outgoing(core, *lines)
     return True
 
 
-def _add_default_commands() -> None:
-    @add_command("/join <channel>")
-    def join(view: View, core: IrcCore, channel: str) -> None:
-        # TODO: plain '/join' for joining the current channel after kick?
-        # currently kicks are not handled yet anyway :(
-        core.join_channel(channel)
-
-    @add_command("/part [<channel>]")
-    def part(view: View, core: IrcCore, channel: str | None = None) -> None:
-        if channel is not None:
-            core.part_channel(channel)
-        elif isinstance(view, ChannelView):
-            core.part_channel(view.channel_name)
-        else:
-            view.add_message("*", ("Usage: /part [<channel>]", []))
-            view.add_message(
-                "*", ("Channel is needed unless you are currently on a channel.", [])
-            )
-
-    # TODO: specifying a reason
-    @add_command("/quit")
-    def quit(view: View, core: IrcCore) -> None:
-        core.quit()
-
-    @add_command("/nick <new_nick>")
-    def nick(view: View, core: IrcCore, new_nick: str) -> None:
-        core.change_nick(new_nick)
-
-    @add_command("/topic <new_topic>")
-    def topic(view: View, core: IrcCore, new_topic: str) -> None:
-        if isinstance(view, ChannelView):
-            core.change_topic(view.channel_name, new_topic)
-        else:
-            view.add_message("*", ("You must be on a channel to change its topic.", []))
-
-    @add_command("/me <message>")
-    def me(view: View, core: IrcCore, message: str) -> None:
-        _send_privmsg(view, core, "\x01ACTION " + message + "\x01")
-
-    # TODO: /msg <nick>, should open up PMView
-    @add_command("/msg <nick> <message>")
-    def msg(view: View, core: IrcCore, nick: str, message: str) -> None:
-        core.send_privmsg(nick, message)
-
-    @add_command("/ns <message>")
-    @add_command("/nickserv <message>")
-    def msg_nickserv(view: View, core: IrcCore, message: str) -> None:
-        return msg(view, core, "NickServ", message)
-
-    @add_command("/ms <message>")
-    @add_command("/memoserv <message>")
-    def msg_memoserv(view: View, core: IrcCore, message: str) -> None:
-        return msg(view, core, "MemoServ", message)
-
-    # TODO: /kick, /ban etc... lots of commands to add
-
-
-_add_default_commands()
+@add_command("/join <channel>")
+def _join(view: View, core: IrcCore, channel: str) -> None:
+    # TODO: plain '/join' for joining the current channel after kick?
+    # currently kicks are not handled yet anyway :(
+    core.join_channel(channel)
+
+
+@add_command("/part [<channel>]")
+def _part(view: View, core: IrcCore, channel: str | None = None) -> None:
+    if channel is not None:
+        core.part_channel(channel)
+    elif isinstance(view, ChannelView):
+        core.part_channel(view.channel_name)
+    else:
+        view.add_message("*", ("Usage: /part [<channel>]", []))
+        view.add_message(
+            "*", ("Channel is needed unless you are currently on a channel.", [])
+        )
+
+
+# TODO: specifying a reason
+@add_command("/quit")
+def _quit(view: View, core: IrcCore) -> None:
+    core.quit()
+
+
+@add_command("/nick <new_nick>")
+def _nick(view: View, core: IrcCore, new_nick: str) -> None:
+    core.change_nick(new_nick)
+
+
+@add_command("/topic <new_topic>")
+def _topic(view: View, core: IrcCore, new_topic: str) -> None:
+    if isinstance(view, ChannelView):
+        core.change_topic(view.channel_name, new_topic)
+    else:
+        view.add_message("*", ("You must be on a channel to change its topic.", []))
+
+
+@add_command("/me <message>")
+def _me(view: View, core: IrcCore, message: str) -> None:
+    view.send_outgoing(core, "\x01ACTION " + message + "\x01")
+
+
+# TODO: /msg <nick>, should open up PMView
+@add_command("/msg <nick> <message>")
+def _msg(view: View, core: IrcCore, nick: str, message: str) -> None:
+    core.send_privmsg(nick, message)
+
+
+@add_command("/ns <message>")
+@add_command("/nickserv <message>")
+def _msg_nickserv(view: View, core: IrcCore, message: str) -> None:
+    core.send_privmsg("NickServ", message)
+
+
+@add_command("/ms <message>")
+@add_command("/memoserv <message>")
+def _msg_memoserv(view: View, core: IrcCore, message: str) -> None:
+    core.send_privmsg("MemoServ", message)
+
+
+# TODO: /kick, /ban etc... lots of commands to add
@@ -179,6 +179,18 @@ class View:
     def on_connectivity_message(self, message: str, *, error: bool = False) -> None:
         self.add_message("", (message, ["error" if error else "info"]))
 
+    def send_outgoing(self, core: backend.IrcCore, *messages: str) -> None:
+        self.add_message(
+            "*",
+            (
+                (
+                    "You can't send messages here. "
+                    "Join a channel instead and send messages there."
+                ),
+                [],
+            ),
+        )
+
     def on_self_changed_nick(self, old: str, new: str) -> None:
         # notify about the nick change everywhere, by putting this to base class
         self.add_message(
@@ -438,6 +450,9 @@ class ChannelView(View):
         )
         self.add_message(sender, *chunks, pinged=pinged)
 
+    def send_outgoing(self, core: backend.IrcCore, *messages: str) -> None:
+        core.send_privmsg_many(self.channel_name, messages)
+
     def on_join(self, nick: str) -> None:
         self.userlist.add_user(nick)
         self.add_message(
@@ -511,6 +526,9 @@ class PMView(View):
         )
         self.add_message(sender, *chunks)
 
+    def send_outgoing(self, core: backend.IrcCore, *messages: str) -> None:
+        core.send_privmsg_many(self.other_nick, messages)
+
     # quit isn't perfect: no way to notice a person quitting if not on a same
     # channel with the user
     def get_relevant_nicks(self) -> list[str]:
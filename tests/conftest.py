@@ -1,3 +1,5 @@
+import os
+import select
 import time
 import tkinter
 import sys
@@ -35,6 +37,7 @@ class _Hircd:
     def __init__(self, hircd_repo):
         self._hircd_repo = hircd_repo
         self.process = None
+        self._unchecked_output = b""
 
     def start(self):
         self.process = subprocess.Popen(
@@ -43,25 +46,36 @@ class _Hircd:
             cwd=self._hircd_repo,
         )
 
-        # Wait for it to start
-        for line in self.process.stderr:
-            assert b"ERROR" not in line
-            if line.startswith(b"[INFO] Starting hircd on "):
-                port = int(line.split(b":")[-1])
-                return port
+        # Wait for it to start, reading whatever is available instead of line by line
+        stderr_fd = self.process.stderr.fileno()
+        os.set_blocking(stderr_fd, False)
+        output = b""
+        while select.select([stderr_fd], [], [], 10)[0]:
+            chunk = os.read(stderr_fd, 4096)
+            if not chunk:
+                break
+            output += chunk
+            assert b"ERROR" not in output
+
+            start = output.find(b"[INFO] Starting hircd on ")
+            end = output.find(b"\n", start)
+            if start != -1 and end != -1:
+                os.set_blocking(stderr_fd, True)
+                self._unchecked_output = output[end:]
+                return int(output[start:end].split(b":")[-1])
         raise RuntimeError
 
     def stop(self):
         self.process.kill()
 
-        output = self.process.stderr.read()
+        output = self._unchecked_output + self.process.stderr.read()
         if b"ERROR" in output:
             print(output.decode("utf-8", errors="replace"))
             raise RuntimeError
 
 
-@pytest.fixture
-def hircd():
+@pytest.fixture(scope="session")
+def hircd_repo():
     clone_url = "https://github.com/fboender/hircd"
     hircd_repo = Path(__file__).absolute().parent / "hircd"
     if not hircd_repo.is_dir():
@@ -77,6 +91,13 @@ def hircd():
         subprocess.check_call(["git", "fetch", clone_url], cwd=hircd_repo)
         subprocess.check_call(["git", "checkout", correct_commit], cwd=hircd_repo)
 
+    return hircd_repo
+
+
+# Each test gets a fresh server, because tests change server state (e.g. topics)
+# and some tests stop the server
+@pytest.fixture
+def hircd(hircd_repo):
     hircd = _Hircd(hircd_repo)
     hircd.start()
     yield hircd
@@ -73,6 +73,11 @@ def test_multiline_sending(alice, bob, wait_until, mocker):
     i = bob.text().index
     assert i("one") < i("two") < i("three") < i("four")
 
+    # Lines are sent all at once, but each must still show up as its own message
+    wait_until(lambda: "four" in alice.text())
+    i = alice.text().index
+    assert i("one") < i("two") < i("three") < i("four")
+
 
 def test_multiline_not_sending(alice, bob, wait_until, mocker):
     mock = mocker.patch("tkinter.messagebox.askyesno")